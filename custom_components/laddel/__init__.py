@@ -34,6 +34,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
+    # Stop the coordinator's scheduled refreshes on unload
+    entry.async_on_unload(coordinator.async_shutdown)
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
@@ -1,14 +1,16 @@
 """Binary sensor platform for Laddel integration."""
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Any
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import CONNECTED_CHARGER_MODES, DOMAIN
 from .coordinator import LaddelDataUpdateCoordinator
 
 
@@ -18,81 +20,114 @@ async def async_setup_entry(
     """Set up Laddel binary sensor based on a config entry."""
     coordinator: LaddelDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
+    async_add_entities(
+        (
+            LaddelActiveSubscriptionBinarySensor(coordinator, entry),
+            LaddelActiveChargingSessionBinarySensor(coordinator, entry),
+            LaddelCarConnectedBinarySensor(coordinator, entry),
+        ),
+        update_before_add=False,
+    )
 
-    # Add active subscription binary sensor
-    entities.append(LaddelActiveSubscriptionBinarySensor(coordinator, entry))
-    
-    # Add active charging session binary sensor
-    entities.append(LaddelActiveChargingSessionBinarySensor(coordinator, entry))
-    
-    # Add car connection binary sensor
-    entities.append(LaddelCarConnectedBinarySensor(coordinator, entry))
 
-    async_add_entities(entities)
+class LaddelBinarySensor(CoordinatorEntity[LaddelDataUpdateCoordinator], BinarySensorEntity):
+    """Base class for Laddel binary sensors."""
 
+    # HA's Entity base is not slotted, so instances still carry a __dict__
+    # (which cached_property relies on); the slots keep our own fixed
+    # fields out of it.
+    __slots__ = ("entry", "_last_state")
 
-class LaddelBinarySensor(BinarySensorEntity):
-    """Base class for Laddel binary sensors."""
+    _attr_attribution = "Data provided by Laddel"
+    _attr_has_entity_name = True
 
     def __init__(self, coordinator: LaddelDataUpdateCoordinator, entry: ConfigEntry) -> None:
         """Initialize the binary sensor."""
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self.entry = entry
-        self._attr_attribution = "Data provided by Laddel"
-        self._attr_has_entity_name = True
+        self._last_state = None
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.coordinator.last_update_success
-
-    @property
+    @cached_property
     def device_info(self):
-        """Return device information."""
+        """Return device information.
+
+        The device registry entry never changes after setup, so cache
+        the first read instead of chasing the coordinator attribute on
+        every registry refresh.
+        """
         return self.coordinator.device_info
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Invalidate cached state and push the new state to HA."""
+        # Drop cached_property values so they are recomputed lazily from
+        # the fresh coordinator data on the next read.
+        self.__dict__.pop("is_on", None)
+        self.__dict__.pop("extra_state_attributes", None)
+
+        # Most refreshes don't change these low-churn sensors; skip the
+        # state-machine write and websocket broadcast when nothing did.
+        new_state = (
+            self.coordinator.last_update_success,
+            self.is_on,
+            self.extra_state_attributes,
+        )
+        if new_state == self._last_state:
+            return
+        self._last_state = new_state
+        super()._handle_coordinator_update()
+
 
 class LaddelActiveSubscriptionBinarySensor(LaddelBinarySensor):
     """Binary sensor for active subscription status."""
 
+    __slots__ = ("_subs_cache_key", "_subs_cache_value")
+
     def __init__(self, coordinator: LaddelDataUpdateCoordinator, entry: ConfigEntry) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator, entry)
         self._attr_name = "Active Subscription"
         self._attr_unique_id = f"{entry.entry_id}_active_subscription"
+        self._subs_cache_key = None
+        self._subs_cache_value = None
 
-    @property
+    @cached_property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        if not self.coordinator.data or "subscription" not in self.coordinator.data:
-            return None
-        
-        subscription_data = self.coordinator.data["subscription"]
+        data = self.coordinator.data
+        subscription_data = data.get("subscription") if data else None
         if not subscription_data:
             return None
-        active_subs = subscription_data.get("activeSubscriptions", [])
+        active_subs = subscription_data.get("activeSubscriptions") or ()
         
         return len(active_subs) > 0 and any(
             sub.get("status") == "ACTIVE" for sub in active_subs
         )
 
-    @property
+    @cached_property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return entity specific state attributes."""
-        if not self.coordinator.data or "subscription" not in self.coordinator.data:
-            return {}
-        
-        subscription_data = self.coordinator.data["subscription"]
+        data = self.coordinator.data
+        subscription_data = data.get("subscription") if data else None
         if not subscription_data:
             return {}
-        active_subs = subscription_data.get("activeSubscriptions", [])
+        active_subs = subscription_data.get("activeSubscriptions") or ()
         
         if not active_subs:
             return {}
-        
+
+        # Subscriptions change rarely (monthly at most) - reuse the
+        # rendered dict as long as the underlying data is unchanged
+        cache_key = tuple(
+            (sub.get("facilityId"), sub.get("status"), sub.get("expirationDate"))
+            for sub in active_subs
+        )
+        if cache_key == self._subs_cache_key:
+            return self._subs_cache_value
+
         # Return info about all active subscriptions
-        return {
+        self._subs_cache_key = cache_key
+        self._subs_cache_value = {
             "active_subscriptions_count": len(active_subs),
             "subscriptions": [
                 {
@@ -107,37 +142,35 @@ class LaddelActiveSubscriptionBinarySensor(LaddelBinarySensor):
                 for sub in active_subs
             ]
         }
+        return self._subs_cache_value
 
 
 class LaddelActiveChargingSessionBinarySensor(LaddelBinarySensor):
     """Binary sensor for active charging session."""
 
+    __slots__ = ()
+
     def __init__(self, coordinator: LaddelDataUpdateCoordinator, entry: ConfigEntry) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator, entry)
         self._attr_name = "Active Charging Session"
         self._attr_unique_id = f"{entry.entry_id}_active_charging_session"
 
-    @property
+    @cached_property
     def is_on(self) -> bool | None:
         """Return true if there's an active charging session."""
-        if not self.coordinator.data or "current_session" not in self.coordinator.data:
+        data = self.coordinator.data
+        if not data or "current_session" not in data:
             return None
-        
-        session_data = self.coordinator.data["current_session"]
-        if not session_data:
-            return False
-        
-        # Check if session type is ACTIVE
-        return session_data.get("type", "").upper() == "ACTIVE"
 
-    @property
+        # Computed once per refresh on the coordinator
+        return self.coordinator.has_active_session
+
+    @cached_property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return entity specific state attributes."""
-        if not self.coordinator.data or "current_session" not in self.coordinator.data:
-            return {}
-        
-        session_data = self.coordinator.data["current_session"]
+        data = self.coordinator.data
+        session_data = data.get("current_session") if data else None
         if not session_data:
             return {}
         
@@ -156,37 +189,30 @@ class LaddelActiveChargingSessionBinarySensor(LaddelBinarySensor):
 class LaddelCarConnectedBinarySensor(LaddelBinarySensor):
     """Binary sensor for car connection status."""
 
+    __slots__ = ()
+
     def __init__(self, coordinator: LaddelDataUpdateCoordinator, entry: ConfigEntry) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator, entry)
         self._attr_name = "Car Connected"
         self._attr_unique_id = f"{entry.entry_id}_car_connected"
 
-    @property
+    @cached_property
     def is_on(self) -> bool | None:
         """Return true if car is connected to charger."""
-        if not self.coordinator.data or "charger_operating_mode" not in self.coordinator.data:
-            return None
-        
-        charger_data = self.coordinator.data["charger_operating_mode"]
+        data = self.coordinator.data
+        charger_data = data.get("charger_operating_mode") if data else None
         if not charger_data:
             return None
         
-        operating_mode = charger_data.get("operatingMode", "")
-        
         # Car is connected if operating mode indicates connection
-        connected_modes = ["CAR_CONNECTED", "CHARGING", "IDLE"]
-        disconnected_modes = ["DISCONNECTED", "AVAILABLE", "OFFLINE", "ERROR"]
-        
-        return operating_mode in connected_modes
+        return charger_data.get("operatingMode", "") in CONNECTED_CHARGER_MODES
 
-    @property
+    @cached_property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return entity specific state attributes."""
-        if not self.coordinator.data or "charger_operating_mode" not in self.coordinator.data:
-            return {}
-        
-        charger_data = self.coordinator.data["charger_operating_mode"]
+        data = self.coordinator.data
+        charger_data = data.get("charger_operating_mode") if data else None
         if not charger_data:
             return {}
         
@@ -197,9 +223,8 @@ class LaddelCarConnectedBinarySensor(LaddelBinarySensor):
         }
         
         # Add session info if available
-        if self.coordinator.data.get("current_session"):
-            session_data = self.coordinator.data["current_session"]
-            if session_data and not session_data.get("errorKey"):
+        if session_data := data.get("current_session"):
+            if not session_data.get("errorKey"):
                 attributes.update({
                     "session_id": session_data.get("sessionId"),
                     "session_type": session_data.get("type"),
@@ -2,12 +2,14 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from typing import Any
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import LaddelDataUpdateCoordinator
@@ -21,39 +23,46 @@ async def async_setup_entry(
     """Set up Laddel button based on a config entry."""
     coordinator: LaddelDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
+    async_add_entities(
+        (
+            LaddelStartChargingButton(coordinator, entry),
+            LaddelStopChargingButton(coordinator, entry),
+        ),
+        update_before_add=False,
+    )
 
-    # Add charging control buttons
-    entities.append(LaddelStartChargingButton(coordinator, entry))
-    entities.append(LaddelStopChargingButton(coordinator, entry))
 
-    async_add_entities(entities)
+class LaddelButton(CoordinatorEntity[LaddelDataUpdateCoordinator], ButtonEntity):
+    """Base class for Laddel buttons."""
 
+    # HA's Entity base is not slotted, so instances still carry a __dict__;
+    # the slots keep our own fixed fields out of it.
+    __slots__ = ("entry",)
 
-class LaddelButton(ButtonEntity):
-    """Base class for Laddel buttons."""
+    _attr_attribution = "Data provided by Laddel"
+    _attr_has_entity_name = True
 
     def __init__(self, coordinator: LaddelDataUpdateCoordinator, entry: ConfigEntry) -> None:
         """Initialize the button."""
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self.entry = entry
-        self._attr_attribution = "Data provided by Laddel"
-        self._attr_has_entity_name = True
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.coordinator.last_update_success
 
-    @property
+    @cached_property
     def device_info(self):
-        """Return device information."""
+        """Return device information.
+
+        The device registry entry never changes after setup, so cache
+        the first read instead of chasing the coordinator attribute on
+        every registry refresh.
+        """
         return self.coordinator.device_info
 
 
 class LaddelStartChargingButton(LaddelButton):
     """Button to start charging session."""
 
+    __slots__ = ()
+
     def __init__(self, coordinator: LaddelDataUpdateCoordinator, entry: ConfigEntry) -> None:
         """Initialize the button."""
         super().__init__(coordinator, entry)
@@ -64,27 +73,14 @@ class LaddelStartChargingButton(LaddelButton):
     @property
     def available(self) -> bool:
         """Return True if button is available for use."""
-        if not super().available:
-            return False
-        
-        # Only available if no active session and car is connected
-        session_data = self.coordinator.data.get("current_session")
-        charger_data = self.coordinator.data.get("charger_operating_mode")
-        
-        # No active session
-        has_active_session = (
-            session_data and 
-            not session_data.get("errorKey") == "noSession" and
-            session_data.get("type", "").upper() == "ACTIVE"
+        # Only available if no active session and car is connected;
+        # both flags are computed once per refresh on the coordinator
+        coordinator = self.coordinator
+        return (
+            super().available
+            and not coordinator.has_active_session
+            and coordinator.car_connected
         )
-        
-        # Car is connected
-        car_connected = False
-        if charger_data:
-            operating_mode = charger_data.get("operatingMode", "")
-            car_connected = operating_mode in ["CAR_CONNECTED", "IDLE"]
-        
-        return not has_active_session and car_connected
 
     async def async_press(self) -> None:
         """Handle the button press."""
@@ -123,8 +119,17 @@ class LaddelStartChargingButton(LaddelButton):
         
         if success:
             _LOGGER.info("Charging session started successfully")
-            # Trigger immediate data refresh
-            await self.coordinator.async_request_refresh()
+            # Optimistically flip the local state so the UI reacts
+            # immediately; the next scheduled poll reconciles
+            data = self.coordinator.data
+            session_data = data.get("current_session")
+            if not session_data or session_data.get("errorKey"):
+                session_data = {}
+                data["current_session"] = session_data
+            session_data["type"] = "ACTIVE"
+            session_data["chargerId"] = charger_id
+            self.coordinator._update_derived_flags(data)
+            self.coordinator.async_update_listeners()
         else:
             _LOGGER.error("Failed to start charging session")
 
@@ -148,6 +153,8 @@ class LaddelStartChargingButton(LaddelButton):
 class LaddelStopChargingButton(LaddelButton):
     """Button to stop charging session."""
 
+    __slots__ = ()
+
     def __init__(self, coordinator: LaddelDataUpdateCoordinator, entry: ConfigEntry) -> None:
         """Initialize the button."""
         super().__init__(coordinator, entry)
@@ -158,17 +165,8 @@ class LaddelStopChargingButton(LaddelButton):
     @property
     def available(self) -> bool:
         """Return True if button is available for use."""
-        if not super().available:
-            return False
-        
         # Only available if there's an active charging session
-        session_data = self.coordinator.data.get("current_session")
-        
-        return (
-            session_data and 
-            not session_data.get("errorKey") == "noSession" and
-            session_data.get("type", "").upper() == "ACTIVE"
-        )
+        return super().available and self.coordinator.has_active_session
 
     async def async_press(self) -> None:
         """Handle the button press."""
@@ -190,8 +188,11 @@ class LaddelStopChargingButton(LaddelButton):
         
         if success:
             _LOGGER.info("Charging session stopped successfully")
-            # Trigger immediate data refresh
-            await self.coordinator.async_request_refresh()
+            # Optimistically flip the local state so the UI reacts
+            # immediately; the next scheduled poll reconciles
+            session_data["type"] = "COMPLETED"
+            self.coordinator._update_derived_flags(self.coordinator.data)
+            self.coordinator.async_update_listeners()
         else:
             _LOGGER.error("Failed to stop charging session")
 
@@ -15,6 +15,13 @@ from .oauth2 import LaddelDirectOAuth2FlowHandler
 
 _LOGGER = logging.getLogger(__name__)
 
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_USERNAME): str,
+        vol.Required(CONF_PASSWORD): str,
+    }
+)
+
 
 class LaddelConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Laddel."""
@@ -30,27 +37,13 @@ class LaddelConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             username = user_input.get(CONF_USERNAME)
             password = user_input.get(CONF_PASSWORD)
-            
+
             if username and password:
                 # Use the OAuth2 flow handler to authenticate and get tokens
                 try:
-                    oauth_handler = LaddelDirectOAuth2FlowHandler()
-                    oauth_handler.hass = self.hass
-                    oauth_handler.flow_id = self.flow_id
-                    oauth_handler.context = self.context
-                    oauth_handler.flow_context = {"username": username, "password": password}
-                    
-                    # Generate PKCE and get session parameters
-                    oauth_handler._generate_pkce()
-                    await oauth_handler._get_session_parameters()
-                    
-                    # Authenticate and get authorization code
-                    auth_code = await oauth_handler._authenticate_with_credentials()
-                    
-                    if auth_code:
-                        # Exchange code for tokens
-                        tokens = await oauth_handler._exchange_code_for_tokens(auth_code)
-                        
+                    tokens = await self._async_get_tokens(username, password)
+
+                    if tokens:
                         # Create config entry in the proper config flow context
                         return self.async_create_entry(
                             title="Laddel EV Charging",
@@ -58,7 +51,7 @@ class LaddelConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         )
                     else:
                         errors["base"] = "invalid_credentials"
-                    
+
                 except Exception as e:
                     _LOGGER.error("Authentication failed: %s", e)
                     if "authentication failed" in str(e).lower():
@@ -70,17 +63,49 @@ class LaddelConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_USERNAME): str,
-                    vol.Required(CONF_PASSWORD): str,
-                }
-            ),
+            data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
 
+    async def _async_get_tokens(self, username: str, password: str) -> dict[str, Any] | None:
+        """Authenticate against Laddel and return OAuth tokens."""
+        oauth_handler = LaddelDirectOAuth2FlowHandler()
+        oauth_handler.hass = self.hass
+        oauth_handler.flow_id = self.flow_id
+        oauth_handler.context = self.context
+        oauth_handler.flow_context = {"username": username, "password": password}
+
+        # Generate PKCE and get session parameters
+        oauth_handler._generate_pkce()
+        await oauth_handler._get_session_parameters()
 
+        # Authenticate and get authorization code
+        auth_code = await oauth_handler._authenticate_with_credentials()
+        if not auth_code:
+            return None
+
+        # Exchange code for tokens
+        return await oauth_handler._exchange_code_for_tokens(auth_code)
 
     async def async_step_import(self, import_info: dict[str, Any]) -> FlowResult:
         """Handle import from configuration.yaml."""
-        return await self.async_step_user(import_info)
+        # Imported configs already carry the credentials, so go straight
+        # to authentication instead of re-entering the form step
+        username = import_info.get(CONF_USERNAME)
+        password = import_info.get(CONF_PASSWORD)
+        if not username or not password:
+            return self.async_abort(reason="missing_credentials")
+
+        try:
+            tokens = await self._async_get_tokens(username, password)
+        except Exception as e:
+            _LOGGER.error("Authentication failed during import: %s", e)
+            return self.async_abort(reason="auth_failed")
+
+        if not tokens:
+            return self.async_abort(reason="invalid_credentials")
+
+        return self.async_create_entry(
+            title="Laddel EV Charging",
+            data=tokens,
+        )
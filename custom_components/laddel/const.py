@@ -1,6 +1,8 @@
 """Constants for the Laddel integration."""
 from typing import Final
 
+from yarl import URL
+
 DOMAIN: Final = "laddel"
 
 CONF_USERNAME: Final = "username"
@@ -9,8 +11,13 @@ CONF_REFRESH_TOKEN: Final = "refresh_token"
 CONF_ACCESS_TOKEN: Final = "access_token"
 CONF_TOKEN_TYPE: Final = "token_type"
 CONF_EXPIRES_IN: Final = "expires_in"
+CONF_EXPIRES_AT: Final = "expires_at"  # absolute epoch expiry, survives restarts
 
 DEFAULT_NAME: Final = "Laddel EV Charging"
+
+# Charger operating modes in which a car is considered connected; shared
+# by the coordinator's car_connected flag and the Car Connected sensor
+CONNECTED_CHARGER_MODES: Final = frozenset({"CAR_CONNECTED", "CHARGING", "IDLE"})
 DEFAULT_SCAN_INTERVAL: Final = 300  # 5 minutes
 CHARGING_SCAN_INTERVAL: Final = 60   # 1 minute when charging
 
@@ -27,9 +34,22 @@ STOP_SESSION_ENDPOINT: Final = "/api/session/stop/jobs/schedule"
 START_SESSION_ENDPOINT: Final = "/api/session/start/jobs/schedule"
 LATEST_CHARGERS_ENDPOINT: Final = "/api/history/latest-used-chargers"
 
+# Pre-parsed request URLs; aiohttp uses yarl.URL objects as-is, so the
+# URL is parsed once at import instead of on every call
+SUBSCRIPTION_URL: Final = URL(BASE_URL + SUBSCRIPTION_ENDPOINT)
+NOTIFICATION_SYNC_URL: Final = URL(BASE_URL + NOTIFICATION_SYNC_ENDPOINT)
+CURRENT_SESSION_URL: Final = URL(BASE_URL + CURRENT_SESSION_ENDPOINT)
+CHARGER_OPERATING_MODE_URL: Final = URL(BASE_URL + CHARGER_OPERATING_MODE_ENDPOINT)
+FACILITY_INFO_URL: Final = URL(BASE_URL + FACILITY_INFO_ENDPOINT)
+HISTORY_SESSIONS_URL: Final = URL(BASE_URL + HISTORY_SESSIONS_ENDPOINT)
+STOP_SESSION_URL: Final = URL(BASE_URL + STOP_SESSION_ENDPOINT)
+START_SESSION_URL: Final = URL(BASE_URL + START_SESSION_ENDPOINT)
+LATEST_CHARGERS_URL: Final = URL(BASE_URL + LATEST_CHARGERS_ENDPOINT)
+
 # OAuth2 endpoints
 OAUTH2_AUTHORIZE: Final = f"{AUTH_URL}/protocol/openid-connect/auth"
 OAUTH2_TOKEN: Final = f"{AUTH_URL}/protocol/openid-connect/token"
+OAUTH2_TOKEN_URL: Final = URL(OAUTH2_TOKEN)
 OAUTH2_CLIENT_ID: Final = "laddel-app-prod"
 OAUTH2_SCOPE: Final = "openid profile email offline_access"
 OAUTH2_REDIRECT_URI: Final = "laddel://oauth/callback"
@@ -1,33 +1,45 @@
 """Data coordinator for Laddel integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
+import time
+from collections import Counter, OrderedDict
+from types import MappingProxyType
+from functools import wraps
+from sys import intern
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import aiohttp
+import ciso8601
+import orjson
+from yarl import URL
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
-    AUTH_URL,
-    BASE_URL,
+    CONNECTED_CHARGER_MODES,
     CONF_REFRESH_TOKEN,
     CONF_ACCESS_TOKEN,
     CONF_TOKEN_TYPE,
     CONF_EXPIRES_IN,
+    CONF_EXPIRES_AT,
     DEFAULT_SCAN_INTERVAL,
     CHARGING_SCAN_INTERVAL,
-    SUBSCRIPTION_ENDPOINT,
-    NOTIFICATION_SYNC_ENDPOINT,
-    CURRENT_SESSION_ENDPOINT,
-    CHARGER_OPERATING_MODE_ENDPOINT,
-    FACILITY_INFO_ENDPOINT,
-    HISTORY_SESSIONS_ENDPOINT,
-    STOP_SESSION_ENDPOINT,
-    START_SESSION_ENDPOINT,
-    LATEST_CHARGERS_ENDPOINT,
+    OAUTH2_TOKEN_URL,
+    SUBSCRIPTION_URL,
+    NOTIFICATION_SYNC_URL,
+    CURRENT_SESSION_URL,
+    CHARGER_OPERATING_MODE_URL,
+    FACILITY_INFO_URL,
+    HISTORY_SESSIONS_URL,
+    STOP_SESSION_URL,
+    START_SESSION_URL,
+    LATEST_CHARGERS_URL,
     USER_AGENT,
     APP_HEADER,
 )
@@ -35,6 +47,258 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+async def _read_json(response) -> Any:
+    """Decode a response body with orjson.
+
+    Faster than response.json() on the larger payloads (recent sessions,
+    facility info) and orjson already ships with Home Assistant.
+    """
+    return orjson.loads(await response.read())
+
+
+async def _noop() -> None:
+    """Placeholder awaitable for gather slots with nothing to fetch."""
+    return None
+
+
+def async_ttl_cache(ttl: timedelta, stale_on_error: bool = True):
+    """Cache an async method's result per (method, args) with a TTL.
+
+    On fetch failure the last cached value is returned if one exists (even
+    if expired), so a flaky backend degrades to stale data instead of an
+    error - the same policy the hand-rolled caches used.
+
+    Expiry is tracked with time.monotonic() floats: immune to wall-clock
+    jumps (NTP/DST) and cheaper than datetime arithmetic per check.
+
+    The cache is a bounded LRU: entries for facilities or chargers the
+    account no longer touches are evicted instead of retained forever.
+    """
+    ttl_seconds = ttl.total_seconds()
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(self, *args):
+            cache = self._ttl_cache
+            key = (func.__name__, args)
+            now = time.monotonic()
+            entry = cache.get(key)
+            if entry and now - entry[1] < ttl_seconds:
+                _LOGGER.debug("Using cached %s%r", func.__name__, args)
+                cache.move_to_end(key)
+                return entry[0]
+
+            # Single-flight: if another caller is already fetching this
+            # key, await its result instead of issuing a duplicate request
+            if (future := self._inflight.get(key)) is not None:
+                _LOGGER.debug("Awaiting in-flight %s%r", func.__name__, args)
+                return await future
+
+            _LOGGER.debug("Fetching fresh %s%r", func.__name__, args)
+            future = self.hass.loop.create_future()
+            self._inflight[key] = future
+            try:
+                try:
+                    value = await func(self, *args)
+                except Exception as e:
+                    if stale_on_error and entry:
+                        # Serve the stale value without restamping it, so
+                        # the next poll retries the fetch instead of
+                        # waiting out another full TTL
+                        _LOGGER.warning(
+                            "Using stale %s cache due to error: %s", func.__name__, e
+                        )
+                        future.set_result(entry[0])
+                        return entry[0]
+                    future.set_exception(e)
+                    # Mark retrieved in case no one else is waiting
+                    future.exception()
+                    raise
+                cache[key] = (value, now)
+                cache.move_to_end(key)
+                while len(cache) > _CACHE_MAX_ENTRIES:
+                    cache.popitem(last=False)
+                future.set_result(value)
+                return value
+            finally:
+                # If the leader was cancelled (entry reload, shutdown) the
+                # future is still pending; cancel it so concurrent waiters
+                # don't hang forever on an abandoned fetch
+                if not future.done():
+                    future.cancel()
+                self._inflight.pop(key, None)
+
+        return wrapper
+
+    return decorator
+
+
+# Per-request timeouts well inside the scan interval, so a hung backend
+# surfaces as an error (and falls back to cached data) instead of
+# stalling the coordinator until HA's own timeout
+_API_TIMEOUT = aiohttp.ClientTimeout(total=20, connect=5, sock_connect=5, sock_read=15)
+_TOKEN_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3)
+
+# Upper bound on cached entries per cache (a handful of endpoints times a
+# handful of facility/charger ids in practice)
+_CACHE_MAX_ENTRIES = 16
+
+# Interned so the hot-path equality checks below reduce to pointer compares
+_ACTIVE = intern("ACTIVE")
+_CHARGING = intern("CHARGING")
+_NO_SESSION = intern("noSession")
+
+# Polling intervals precomputed once; _update_charging_state just swaps
+# between the two instead of building a timedelta per flip
+_INTERVAL_CHARGING = timedelta(seconds=CHARGING_SCAN_INTERVAL)
+_INTERVAL_IDLE = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+
+# (session type, charger operating mode) while actively charging; the
+# mode comes from the API already uppercase, the type via _type_upper
+_CHARGING_STATE = (_ACTIVE, _CHARGING)
+
+# Fallback charging capacity when the facility doesn't report kweffect
+# (typical Norwegian home chargers)
+_DEFAULT_MAX_KW = 22.0
+
+# Endpoints eligible for conditional GET (ETag/If-Modified-Since). Only
+# the TTL-cached endpoints qualify: their decoded bodies are never
+# mutated. The live session payload is mutated in place (_type_upper
+# normalization, the buttons' optimistic updates), so replaying a cached
+# reference for it on a 304 would echo local state back as server truth.
+_CONDITIONAL_URLS = frozenset(
+    {SUBSCRIPTION_URL, FACILITY_INFO_URL, LATEST_CHARGERS_URL, CHARGER_OPERATING_MODE_URL}
+)
+
+
+def _parse_iso(value: str | None) -> datetime | None:
+    """Parse an API ISO timestamp.
+
+    ciso8601 ships with Home Assistant, handles the trailing Z natively
+    (no str.replace allocation) and parses at C speed.
+    """
+    if not value:
+        return None
+    try:
+        parsed = ciso8601.parse_datetime(value)
+    except (ValueError, TypeError):
+        return None
+    if parsed.tzinfo is None:
+        # The API's timestamps are UTC; without this, subtracting a naive
+        # datetime from the aware "now" in _compute_derived would raise
+        # TypeError and fail the whole refresh
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _compute_derived(data: dict[str, Any]) -> dict[str, Any]:
+    """Pre-compute the expensive sensor values once per refresh.
+
+    Home Assistant reads entity properties many times per update cycle
+    (state machine, recorder, templates); doing the datetime parsing and
+    list scans here makes each of those reads a plain dict lookup.
+    """
+    derived: dict[str, Any] = {}
+    now = datetime.now(timezone.utc)
+
+    facility_data = data.get("facility")
+    derived["max_charging_capacity"] = (
+        facility_data.get("kweffect") if facility_data else None
+    ) or _DEFAULT_MAX_KW
+
+    session_data = data.get("current_session")
+    if session_data and session_data.get("errorKey") != _NO_SESSION:
+        start_dt = _parse_iso(session_data.get("startTime"))
+        if start_dt:
+            derived["charging_duration"] = int((now - start_dt).total_seconds() / 60)
+
+        # Average power over the session; only meaningful while charging
+        if (
+            session_data.get("_type_upper"),
+            session_data.get("chargerOperatingMode"),
+        ) != _CHARGING_STATE:
+            power = 0.0
+        elif start_dt is None:
+            power = 0.0
+        elif not (energy_kwh := session_data.get("charged")) or energy_kwh <= 0:
+            # Very new session with nothing metered yet: estimate
+            power = 11.0
+        elif (duration_hours := (now - start_dt).total_seconds() / 3600) <= 0:
+            power = 0.0
+        else:
+            # Raw value; display rounding is delegated to HA via the
+            # sensor's suggested_display_precision
+            power = min(energy_kwh / duration_hours, derived["max_charging_capacity"])
+        derived["charging_power"] = power
+
+    if facility_data := data.get("facility"):
+        derived["charger_count"] = len(facility_data.get("chargers") or ())
+        derived["facility_address"] = ", ".join(
+            v
+            for v in (
+                facility_data.get("address"),
+                facility_data.get("postalCode"),
+                facility_data.get("city"),
+            )
+            if v
+        ) or None
+
+    if recent_data := data.get("recent_sessions"):
+        if receipts := recent_data.get("receipts"):
+            latest_receipt = receipts[0]
+            if (cost := latest_receipt.get("totalAmount")) is not None:
+                derived["last_session_cost"] = round(cost, 2)
+            derived["last_session_cost_attrs"] = MappingProxyType(
+                {
+                    "session_start": latest_receipt.get("sessionStart"),
+                    "session_end": latest_receipt.get("sessionEnd"),
+                    "charger_name": latest_receipt.get("chargerName"),
+                    "facility_name": latest_receipt.get("facilityName"),
+                    "power_consumption": latest_receipt.get("powerConsumption"),
+                    "payment_status": latest_receipt.get("paymentStatus"),
+                    "currency": latest_receipt.get("currency"),
+                    "total_excl_vat": latest_receipt.get("totalPriceExclVat"),
+                    "total_vat": latest_receipt.get("totalVat"),
+                }
+            )
+            # Receipt scans happen here, not per attribute read; the
+            # read-only proxies keep a stable identity for the lifetime
+            # of this refresh so attribute serialization can be cached
+            derived["session_count_attrs"] = MappingProxyType(
+                {
+                    "payment_status_breakdown": dict(
+                        Counter(r.get("paymentStatus", "unknown") for r in receipts)
+                    ),
+                    "total_sessions": len(receipts),
+                }
+            )
+        if summaries := recent_data.get("monthlySummaries"):
+            derived["monthly_cost_attrs"] = MappingProxyType(
+                {
+                    "monthly_summaries": {
+                        month: {
+                            "total_amount": summary.get("totalAmount"),
+                            "session_count": summary.get("sessionCount"),
+                        }
+                        for summary in summaries
+                        if (month := summary.get("month"))
+                    }
+                }
+            )
+            # Month key in local time, matching what users see on bills;
+            # reuses the single "now" stamped for this refresh
+            current_month = now.astimezone().strftime("%Y-%m")
+            for summary in summaries:
+                if summary.get("month") == current_month:
+                    if (total := summary.get("totalAmount")) is not None:
+                        derived["monthly_cost"] = round(total, 2)
+                    if (count := summary.get("sessionCount")) is not None:
+                        derived["session_count"] = int(count)
+                    break
+
+    return derived
+
+
 class LaddelDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Laddel data."""
 
@@ -43,20 +307,37 @@ class LaddelDataUpdateCoordinator(DataUpdateCoordinator):
         self.entry = entry
         self.refresh_token = entry.data.get(CONF_REFRESH_TOKEN)
         self.access_token = entry.data.get(CONF_ACCESS_TOKEN)
-        self.token_expires = None
-        
-        # Calculate token expiration if we have an access token
-        if self.access_token and CONF_EXPIRES_IN in entry.data:
-            expires_in = entry.data.get(CONF_EXPIRES_IN, 3600)
-            self.token_expires = datetime.now() + timedelta(seconds=expires_in)
+        # Monotonic deadline for the access token (None = unknown)
+        self.token_expires: float | None = None
+
+        # Restore token expiry across restarts: a persisted absolute
+        # timestamp lets a still-valid token skip the first refresh
+        # round-trip entirely. CONF_EXPIRES_IN is the legacy fallback
+        # for entries written before expires_at existed.
+        if self.access_token:
+            if (expires_at := entry.data.get(CONF_EXPIRES_AT)) is not None:
+                remaining = expires_at - time.time()
+                if remaining > 0:
+                    self.token_expires = time.monotonic() + remaining
+            elif CONF_EXPIRES_IN in entry.data:
+                expires_in = entry.data.get(CONF_EXPIRES_IN, 3600)
+                self.token_expires = time.monotonic() + expires_in
 
         super().__init__(
             hass,
             _LOGGER,
             name="Laddel",
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            # Coalesce bursts of async_request_refresh (e.g. rapid button
+            # presses) into a single API sweep
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=2.0, immediate=False
+            ),
         )
         
+        # Authorization header, rebuilt only when the access token changes
+        self._auth_header_cache: dict[str, str] | None = None
+
         # Device information
         self.device_info = None
         
@@ -64,111 +345,172 @@ class LaddelDataUpdateCoordinator(DataUpdateCoordinator):
         self._is_charging = False
         self._last_session_id = None
         self._latest_charger_id = None
+
+        # Flags derived once per refresh so entities don't re-walk the
+        # data dict on every state read
+        # Current-session payload (None when absent or "noSession")
+        self.active_session: dict[str, Any] | None = None
+        self.has_active_session = False
+        self.car_connected = False
+        self.active_charger_id = None
+        # Pre-derived sensor values, rebuilt by _update_derived_flags
+        self.derived: dict[str, Any] = {}
+        # First active subscription, shared by the subscription sensors
+        self.active_subscription: dict[str, Any] | None = None
         
-        # Cache for infrequent data to reduce API calls
-        self._facility_cache = {}
-        self._facility_cache_time = None
-        self._latest_chargers_cache = None
-        self._latest_chargers_cache_time = None
-        self._subscription_cache = None
-        self._subscription_cache_time = None
+        # Bounded LRU cache for infrequent data to reduce API calls,
+        # keyed by (method name, args) - see async_ttl_cache
+        self._ttl_cache: OrderedDict = OrderedDict()
+        # In-flight futures for single-flight request coalescing
+        self._inflight = {}
+        # Serializes token refreshes across concurrent fetches
+        self._token_lock = asyncio.Lock()
+        # HTTP validators and last body per GET, for conditional requests
+        # (bounded like the TTL cache so old facilities don't accumulate)
+        self._conditional: OrderedDict = OrderedDict()
+
+    def _auth_headers(self) -> dict[str, str]:
+        """Return the per-request headers for the current access token.
+
+        The static headers ride along per-request because the requests go
+        out over HA's application-wide session, whose defaults we don't
+        own; the dict is cached and only rebuilt when the token changes.
+        """
+        if self._auth_header_cache is None:
+            self._auth_header_cache = {
+                "Authorization": f"Bearer {self.access_token}",
+                "User-Agent": USER_AGENT,
+                "x-app": APP_HEADER,
+                "Accept-Encoding": "gzip",
+            }
+        return self._auth_header_cache
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data via Laddel API."""
         try:
-            # Ensure we have a valid access token with buffer time
+            # Ensure we have a valid access token with buffer time.
+            # Double-checked locking: the fast path costs nothing, and
+            # under contention only one coroutine hits the token endpoint.
             if self._token_needs_refresh():
-                await self._refresh_access_token()
+                async with self._token_lock:
+                    if self._token_needs_refresh():
+                        await self._refresh_access_token()
 
             # Fetch all available data
             data = {}
-            
-            # Fetch current charging session first (contains facility ID)
-            try:
-                session_data = await self._fetch_current_session()
-                data["current_session"] = session_data
-                
-                # Check if charging status changed for dynamic polling
-                await self._update_charging_state(session_data)
-                
-            except Exception as e:
-                _LOGGER.warning("Failed to fetch current session: %s", e)
+            prev = self.data
+
+            # While idle the session history cannot have changed, so only
+            # refetch recent sessions while charging, on the cycle right
+            # after a session ends (_last_session_id still set), or when
+            # we have no previous data to carry forward.
+            fetch_recent = (
+                self._is_charging or self._last_session_id is not None or prev is None
+            )
+
+            # Phase 1: the independent endpoints, fetched concurrently so
+            # wall-clock time is one round-trip instead of four.
+            # return_exceptions keeps one failure from cancelling siblings.
+            session_data, subscription_data, latest_chargers, recent_sessions = (
+                await asyncio.gather(
+                    self._fetch_current_session(),
+                    self._fetch_subscription_data(),
+                    self._fetch_latest_chargers(),
+                    self._fetch_recent_sessions() if fetch_recent else _noop(),
+                    return_exceptions=True,
+                )
+            )
+
+            # Current charging session (contains facility ID)
+            if isinstance(session_data, BaseException):
+                _LOGGER.warning("Failed to fetch current session: %s", session_data)
+                session_data = None
                 data["current_session"] = None
                 # Reset charging state if we can't fetch session data
                 await self._update_charging_state(None)
+            else:
+                if session_data:
+                    # Normalize the session type once at ingest so
+                    # consumers compare without re-allocating via .upper()
+                    session_data["_type_upper"] = intern(
+                        (session_data.get("type") or "").upper()
+                    )
+                data["current_session"] = session_data
 
-            # Get facility ID from session data or subscription data
-            facility_id = None
-            if data.get("current_session"):
-                facility_id = data["current_session"].get("facilityId")
+                # Check if charging status changed for dynamic polling
+                await self._update_charging_state(session_data)
 
-            # Fetch subscription data (cached for 24 hours - rarely changes)
-            try:
-                subscription_data = await self._fetch_subscription_data_cached()
-                data["subscription"] = subscription_data
-                
-                # If we don't have facility ID from session, get it from subscription
-                if not facility_id and subscription_data and subscription_data.get("activeSubscriptions"):
-                    facility_id = subscription_data["activeSubscriptions"][0].get("facilityId")
-                    
-            except Exception as e:
-                _LOGGER.warning("Failed to fetch subscription data: %s", e)
-                data["subscription"] = None
+            # Subscription data (cached for 24 hours - rarely changes)
+            if isinstance(subscription_data, BaseException):
+                _LOGGER.warning("Failed to fetch subscription data: %s", subscription_data)
+                subscription_data = None
+            data["subscription"] = subscription_data
+
+            # Latest used chargers (cached)
+            if isinstance(latest_chargers, BaseException):
+                _LOGGER.warning("Failed to fetch latest chargers: %s", latest_chargers)
+                latest_chargers = None
+            data["latest_chargers"] = latest_chargers
+            # Store the latest charger ID for controls
+            if latest_chargers and latest_chargers.get("chargers"):
+                self._latest_charger_id = latest_chargers["chargers"][0].get("chargerId")
+
+            # Recent charging sessions for cost tracking
+            if isinstance(recent_sessions, BaseException):
+                _LOGGER.warning("Failed to fetch recent sessions: %s", recent_sessions)
+                recent_sessions = None
+            if not fetch_recent:
+                recent_sessions = prev.get("recent_sessions")
+            data["recent_sessions"] = recent_sessions
 
-            # Fetch facility information using the facility ID (cached)
-            try:
-                if facility_id:
-                    facility_data = await self._fetch_facility_info_cached(str(facility_id))
-                    data["facility"] = facility_data
-                    
-                    # Create device info from facility data
-                    if facility_data:
-                        facility_name = facility_data.get("facilityName", "Laddel Account")
-                        self.device_info = {
-                            "identifiers": {("laddel", str(facility_id))},
-                            "name": facility_name,
-                            "manufacturer": "Laddel",
-                            "model": "EV Charging Facility",
-                            "sw_version": "1.0",
-                        }
-            except Exception as e:
-                _LOGGER.warning("Failed to fetch facility info: %s", e)
-                data["facility"] = None
+            # Get facility ID from session data or subscription data
+            facility_id = None
+            if session_data:
+                facility_id = session_data.get("facilityId")
+            if not facility_id and subscription_data and subscription_data.get("activeSubscriptions"):
+                facility_id = subscription_data["activeSubscriptions"][0].get("facilityId")
 
-            # Fetch latest used chargers (cached)
-            try:
-                latest_chargers = await self._fetch_latest_chargers_cached()
-                data["latest_chargers"] = latest_chargers
-                
-                # Store the latest charger ID for controls
-                if latest_chargers and latest_chargers.get("chargers"):
-                    self._latest_charger_id = latest_chargers["chargers"][0].get("chargerId")
-            except Exception as e:
-                _LOGGER.warning("Failed to fetch latest chargers: %s", e)
-                data["latest_chargers"] = None
-
-            # Fetch charger operating mode for current session charger or latest charger
+            # Charger to query for operating mode: current session charger
+            # or latest used charger
             charger_id = None
-            if data.get("current_session") and data["current_session"].get("chargerId"):
-                charger_id = data["current_session"]["chargerId"]
+            if session_data and session_data.get("chargerId"):
+                charger_id = session_data["chargerId"]
             elif self._latest_charger_id:
                 charger_id = self._latest_charger_id
-                
+
+            # Phase 2: the fetches that depend on IDs resolved in phase 1
+            facility_data, charger_data = await asyncio.gather(
+                self._fetch_facility_info(str(facility_id)) if facility_id else _noop(),
+                self._fetch_charger_operating_mode(charger_id) if charger_id else _noop(),
+                return_exceptions=True,
+            )
+
+            # Facility information (cached)
+            if isinstance(facility_data, BaseException):
+                _LOGGER.warning("Failed to fetch facility info: %s", facility_data)
+                facility_data = None
+            if facility_id:
+                data["facility"] = facility_data
+
+                # Create device info from facility data
+                if facility_data:
+                    facility_name = facility_data.get("facilityName", "Laddel Account")
+                    self.device_info = {
+                        "identifiers": {("laddel", str(facility_id))},
+                        "name": facility_name,
+                        "manufacturer": "Laddel",
+                        "model": "EV Charging Facility",
+                        "sw_version": "1.0",
+                    }
+
+            # Charger operating mode
+            if isinstance(charger_data, BaseException):
+                _LOGGER.warning("Failed to fetch charger operating mode: %s", charger_data)
+                charger_data = None
             if charger_id:
-                try:
-                    charger_data = await self._fetch_charger_operating_mode(charger_id)
-                    data["charger_operating_mode"] = charger_data
-                except Exception as e:
-                    _LOGGER.warning("Failed to fetch charger operating mode: %s", e)
-                    data["charger_operating_mode"] = None
+                data["charger_operating_mode"] = charger_data
 
-            # Fetch recent charging sessions for cost tracking
-            try:
-                recent_sessions = await self._fetch_recent_sessions()
-                data["recent_sessions"] = recent_sessions
-            except Exception as e:
-                _LOGGER.warning("Failed to fetch recent sessions: %s", e)
-                data["recent_sessions"] = None
+            self._update_derived_flags(data)
 
             data["last_update"] = datetime.now().isoformat()
             return data
@@ -177,6 +519,39 @@ class LaddelDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Error updating Laddel data: %s", err)
             raise UpdateFailed(f"Error updating Laddel data: {err}") from err
 
+    def _update_derived_flags(self, data: dict[str, Any]) -> None:
+        """Compute per-refresh flags shared by all entities."""
+        session_data = data.get("current_session")
+        if session_data:
+            # Re-derive here as well so optimistic in-place mutations of
+            # "type" (button presses) stay consistent
+            session_data["_type_upper"] = intern((session_data.get("type") or "").upper())
+        self.active_session = (
+            session_data
+            if session_data and session_data.get("errorKey") != _NO_SESSION
+            else None
+        )
+        self.has_active_session = bool(
+            session_data
+            and session_data.get("errorKey") != _NO_SESSION
+            and session_data.get("_type_upper") == _ACTIVE
+        )
+        self.active_charger_id = session_data.get("chargerId") if session_data else None
+
+        charger_data = data.get("charger_operating_mode")
+        self.car_connected = bool(
+            charger_data
+            and charger_data.get("operatingMode", "") in CONNECTED_CHARGER_MODES
+        )
+
+        subscription_data = data.get("subscription")
+        subs = (
+            subscription_data.get("activeSubscriptions") if subscription_data else None
+        )
+        self.active_subscription = subs[0] if subs else None
+
+        self.derived = _compute_derived(data)
+
     def _token_needs_refresh(self) -> bool:
         """Check if access token needs refresh with buffer time."""
         if not self.access_token:
@@ -188,72 +563,112 @@ class LaddelDataUpdateCoordinator(DataUpdateCoordinator):
             return True
         
         # Refresh 30 seconds before expiry to avoid race conditions
-        buffer_time = timedelta(seconds=30)
-        needs_refresh = datetime.now() >= (self.token_expires - buffer_time)
+        needs_refresh = time.monotonic() >= self.token_expires - 30
         
         if needs_refresh:
             _LOGGER.debug("Access token expires soon - refresh needed")
         
         return needs_refresh
 
-    async def _make_api_request(self, url: str, method: str = "GET", data: dict = None, retry_on_401: bool = True) -> dict[str, Any]:
+    async def _api_get(self, url: URL, params: dict | None = None) -> dict[str, Any]:
+        """GET a Laddel API URL and return the decoded JSON."""
+        if not self.access_token:
+            raise UpdateFailed("No access token available")
+
+        return await self._make_api_request(url, params=params)
+
+    async def _api_post(self, url: URL, data: dict | None = None) -> dict[str, Any]:
+        """POST to a Laddel API URL and return the decoded JSON."""
+        if not self.access_token:
+            raise UpdateFailed("No access token available")
+
+        return await self._make_api_request(url, method="POST", data=data)
+
+    def _conditional_headers(self, cond_key: tuple | None) -> dict[str, str]:
+        """Return request headers, adding validators for conditional GETs."""
+        headers = self._auth_headers()
+        if cond_key is not None and (cached := self._conditional.get(cond_key)) is not None:
+            headers = {**headers, **cached[0]}
+        return headers
+
+    async def _handle_get_response(self, response, cond_key: tuple | None) -> dict[str, Any]:
+        """Decode a GET response, honoring 304 Not Modified."""
+        if response.status == 304 and cond_key is not None and (cached := self._conditional.get(cond_key)):
+            _LOGGER.debug("304 Not Modified for %s", cond_key[0])
+            return cached[1]
+        if response.status != 200:
+            text = await response.text()
+            _LOGGER.error("API request failed: %s - %s", response.status, text)
+            raise UpdateFailed(f"API request failed: {response.status}")
+        body = await _read_json(response)
+        if cond_key is None:
+            return body
+        validators = {}
+        if etag := response.headers.get("ETag"):
+            validators["If-None-Match"] = etag
+        if last_modified := response.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = last_modified
+        if validators:
+            self._conditional[cond_key] = (validators, body)
+            self._conditional.move_to_end(cond_key)
+            while len(self._conditional) > _CACHE_MAX_ENTRIES:
+                self._conditional.popitem(last=False)
+        return body
+
+    async def _make_api_request(self, url: URL, method: str = "GET", data: dict = None, retry_on_401: bool = True, params: dict | None = None) -> dict[str, Any]:
         """Make API request with automatic token refresh on 401."""
-        headers = {
-            "User-Agent": USER_AGENT,
-            "x-app": APP_HEADER,
-            "Accept-Encoding": "gzip",
-            "Authorization": f"Bearer {self.access_token}",
-            "Host": "api.laddel.no",
-        }
-        
-        if method == "POST":
-            headers["Content-Type"] = "application/json"
-
-        async with aiohttp.ClientSession() as session:
-            if method == "GET":
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 401 and retry_on_401:
-                        _LOGGER.debug("Got 401, refreshing token and retrying")
-                        await self._refresh_access_token()
-                        # Update authorization header with new token
-                        headers["Authorization"] = f"Bearer {self.access_token}"
-                        # Retry the request
-                        async with session.get(url, headers=headers) as retry_response:
-                            if retry_response.status != 200:
-                                text = await retry_response.text()
-                                _LOGGER.error("API request failed after token refresh: %s - %s", retry_response.status, text)
-                                raise UpdateFailed(f"API request failed: {retry_response.status}")
-                            return await retry_response.json()
-                    elif response.status != 200:
-                        text = await response.text()
-                        _LOGGER.error("API request failed: %s - %s", response.status, text)
-                        raise UpdateFailed(f"API request failed: {response.status}")
-                    return await response.json()
-            else:  # POST
-                json_data = data if data else {}
-                async with session.post(url, headers=headers, json=json_data) as response:
-                    if response.status == 401 and retry_on_401:
-                        _LOGGER.debug("Got 401, refreshing token and retrying")
-                        await self._refresh_access_token()
-                        headers["Authorization"] = f"Bearer {self.access_token}"
-                        async with session.post(url, headers=headers, json=json_data) as retry_response:
-                            if retry_response.status not in [200, 201]:
-                                text = await retry_response.text()
-                                _LOGGER.error("API request failed after token refresh: %s - %s", retry_response.status, text)
-                                raise UpdateFailed(f"API request failed: {retry_response.status}")
-                            return await retry_response.json()
-                    elif response.status not in [200, 201]:
-                        text = await response.text()
-                        _LOGGER.error("API request failed: %s - %s", response.status, text)
-                        raise UpdateFailed(f"API request failed: {response.status}")
-                    return await response.json()
+        session = async_get_clientsession(self.hass)
+        if method == "GET":
+            # Conditional GET: when the server gave us validators for this
+            # URL+params, revalidate instead of re-downloading the body
+            # (TTL-cached endpoints only; see _CONDITIONAL_URLS)
+            cond_key = (
+                (url, tuple(sorted(params.items())) if params else None)
+                if url in _CONDITIONAL_URLS
+                else None
+            )
+            async with session.get(url, headers=self._conditional_headers(cond_key), params=params, timeout=_API_TIMEOUT) as response:
+                if response.status == 401 and retry_on_401:
+                    _LOGGER.debug("Got 401, refreshing token and retrying")
+                    await self._refresh_token_once(self.access_token)
+                    # Retry the request with the refreshed token
+                    async with session.get(url, headers=self._conditional_headers(cond_key), params=params, timeout=_API_TIMEOUT) as retry_response:
+                        return await self._handle_get_response(retry_response, cond_key)
+                return await self._handle_get_response(response, cond_key)
+        else:  # POST
+            json_data = data if data else {}
+            async with session.post(url, headers=self._auth_headers(), json=json_data, timeout=_API_TIMEOUT) as response:
+                if response.status == 401 and retry_on_401:
+                    _LOGGER.debug("Got 401, refreshing token and retrying")
+                    await self._refresh_token_once(self.access_token)
+                    async with session.post(url, headers=self._auth_headers(), json=json_data, timeout=_API_TIMEOUT) as retry_response:
+                        if retry_response.status not in [200, 201]:
+                            text = await retry_response.text()
+                            _LOGGER.error("API request failed after token refresh: %s - %s", retry_response.status, text)
+                            raise UpdateFailed(f"API request failed: {retry_response.status}")
+                        return await _read_json(retry_response)
+                elif response.status not in [200, 201]:
+                    text = await response.text()
+                    _LOGGER.error("API request failed: %s - %s", response.status, text)
+                    raise UpdateFailed(f"API request failed: {response.status}")
+                return await _read_json(response)
+
+    async def _refresh_token_once(self, rejected_token: str | None) -> None:
+        """Refresh the access token unless another coroutine already did.
+
+        Several parallel requests can observe the same 401; only the first
+        one through the lock refreshes, the rest reuse the new token.
+        """
+        async with self._token_lock:
+            if self.access_token == rejected_token:
+                await self._refresh_access_token()
 
     async def _refresh_access_token(self) -> None:
         """Refresh the access token using the refresh token."""
         if not self.refresh_token:
             raise UpdateFailed("No refresh token available")
 
-        token_url = f"{AUTH_URL}/protocol/openid-connect/token"
+        token_url = OAUTH2_TOKEN_URL
         
         data = {
             "grant_type": "refresh_token",
@@ -268,68 +683,67 @@ class LaddelDataUpdateCoordinator(DataUpdateCoordinator):
             "Accept": "application/json",
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(token_url, data=data, headers=headers) as response:
-                if response.status != 200:
-                    text = await response.text()
-                    _LOGGER.error("Failed to refresh token: %s - %s", response.status, text)
-                    raise UpdateFailed("Failed to refresh access token")
-
-                token_data = await response.json()
-                self.access_token = token_data.get("access_token")
-                expires_in = token_data.get("expires_in", 300)  # Default 5 minutes
-                self.token_expires = datetime.now() + timedelta(seconds=expires_in)
-
-                _LOGGER.debug("Access token refreshed - expires in %d seconds", expires_in)
-
-                # Update the refresh token if a new one was provided
-                if "refresh_token" in token_data:
-                    self.refresh_token = token_data["refresh_token"]
-                    _LOGGER.debug("Refresh token updated")
-                    
-                    # Update the config entry with the new tokens
-                    hass = self.hass
-                    hass.config_entries.async_update_entry(
-                        self.entry,
-                        data={
-                            **self.entry.data,
-                            CONF_REFRESH_TOKEN: self.refresh_token,
-                            CONF_ACCESS_TOKEN: self.access_token,
-                            CONF_EXPIRES_IN: expires_in,
-                        }
-                    )
-
+        session = async_get_clientsession(self.hass)
+        async with session.post(token_url, data=data, headers=headers, timeout=_TOKEN_TIMEOUT) as response:
+            if response.status != 200:
+                text = await response.text()
+                _LOGGER.error("Failed to refresh token: %s - %s", response.status, text)
+                raise UpdateFailed("Failed to refresh access token")
+
+            token_data = await _read_json(response)
+            self.access_token = token_data.get("access_token")
+            self._auth_header_cache = None
+            expires_in = token_data.get("expires_in", 300)  # Default 5 minutes
+            self.token_expires = time.monotonic() + expires_in
+
+            _LOGGER.debug("Access token refreshed - expires in %d seconds", expires_in)
+
+            # Persist only on actual refresh-token rotation. The entry
+            # write hits storage, and the common case (Keycloak returning
+            # the same refresh token) changes nothing worth flushing;
+            # expires_in lives in memory via self.token_expires.
+            if (
+                "refresh_token" in token_data
+                and token_data["refresh_token"] != self.refresh_token
+            ):
+                self.refresh_token = token_data["refresh_token"]
+                _LOGGER.debug("Refresh token rotated, updating config entry")
+
+                # Update the config entry with the new tokens
+                hass = self.hass
+                hass.config_entries.async_update_entry(
+                    self.entry,
+                    data={
+                        **self.entry.data,
+                        CONF_REFRESH_TOKEN: self.refresh_token,
+                        CONF_ACCESS_TOKEN: self.access_token,
+                        CONF_EXPIRES_IN: expires_in,
+                        CONF_EXPIRES_AT: time.time() + expires_in,
+                    }
+                )
+
+    # Subscriptions auto-renew and rarely change
+    @async_ttl_cache(timedelta(hours=24))
     async def _fetch_subscription_data(self) -> dict[str, Any]:
         """Fetch subscription data from Laddel API."""
-        if not self.access_token:
-            raise UpdateFailed("No access token available")
-
-        url = f"{BASE_URL}{SUBSCRIPTION_ENDPOINT}"
-        return await self._make_api_request(url)
+        return await self._api_get(SUBSCRIPTION_URL)
 
     async def _fetch_current_session(self) -> dict[str, Any]:
         """Fetch current charging session from Laddel API."""
-        if not self.access_token:
-            raise UpdateFailed("No access token available")
-
-        url = f"{BASE_URL}{CURRENT_SESSION_ENDPOINT}"
-        return await self._make_api_request(url)
+        return await self._api_get(CURRENT_SESSION_URL)
 
+    # Facility info rarely changes
+    @async_ttl_cache(timedelta(hours=1))
     async def _fetch_facility_info(self, facility_id: str) -> dict[str, Any]:
         """Fetch facility information from Laddel API."""
-        if not self.access_token:
-            raise UpdateFailed("No access token available")
-
-        url = f"{BASE_URL}{FACILITY_INFO_ENDPOINT}?id={facility_id}"
-        return await self._make_api_request(url)
+        return await self._api_get(FACILITY_INFO_URL, {"id": facility_id})
 
+    # Effectively static per charger for long stretches; the short TTL
+    # mainly elides refetches during the fast 60-second charging poll
+    @async_ttl_cache(timedelta(minutes=5))
     async def _fetch_charger_operating_mode(self, charger_id: str) -> dict[str, Any]:
         """Fetch charger operating mode from Laddel API."""
-        if not self.access_token:
-            raise UpdateFailed("No access token available")
-
-        url = f"{BASE_URL}{CHARGER_OPERATING_MODE_ENDPOINT}?chargerId={charger_id}"
-        return await self._make_api_request(url)
+        return await self._api_get(CHARGER_OPERATING_MODE_URL, {"chargerId": charger_id})
 
     async def sync_notification_token(self, fcm_token: str, installation_id: str) -> bool:
         """Sync notification token with Laddel API."""
@@ -337,16 +751,7 @@ class LaddelDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error("No access token available for notification sync")
             return False
 
-        url = f"{BASE_URL}{NOTIFICATION_SYNC_ENDPOINT}"
-        
-        headers = {
-            "User-Agent": USER_AGENT,
-            "x-app": APP_HEADER,
-            "Accept-Encoding": "gzip",
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.access_token}",
-            "Host": "api.laddel.no",
-        }
+        url = NOTIFICATION_SYNC_URL
 
         data = {
             "fcmToken": fcm_token,
@@ -354,15 +759,15 @@ class LaddelDataUpdateCoordinator(DataUpdateCoordinator):
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=data, headers=headers) as response:
-                    if response.status != 200:
-                        text = await response.text()
-                        _LOGGER.error("Failed to sync notification token: %s - %s", response.status, text)
-                        return False
+            session = async_get_clientsession(self.hass)
+            async with session.post(url, json=data, headers=self._auth_headers(), timeout=_API_TIMEOUT) as response:
+                if response.status != 200:
+                    text = await response.text()
+                    _LOGGER.error("Failed to sync notification token: %s - %s", response.status, text)
+                    return False
                     
-                    _LOGGER.info("Notification token synced successfully")
-                    return True
+                _LOGGER.info("Notification token synced successfully")
+                return True
         except Exception as e:
             _LOGGER.error("Error syncing notification token: %s", e)
             return False
@@ -373,9 +778,10 @@ class LaddelDataUpdateCoordinator(DataUpdateCoordinator):
         current_session_id = None
         
         if session_data:
-            session_type = session_data.get("type", "").upper()
-            charger_mode = session_data.get("chargerOperatingMode", "")
-            current_charging = (session_type == "ACTIVE" and charger_mode == "CHARGING")
+            current_charging = (
+                session_data.get("_type_upper"),
+                session_data.get("chargerOperatingMode"),
+            ) == _CHARGING_STATE
             current_session_id = session_data.get("sessionId")
         
         # Check if charging state changed
@@ -383,13 +789,14 @@ class LaddelDataUpdateCoordinator(DataUpdateCoordinator):
             self._is_charging = current_charging
             
             # Adjust polling interval
-            new_interval = CHARGING_SCAN_INTERVAL if current_charging else DEFAULT_SCAN_INTERVAL
-            self.update_interval = timedelta(seconds=new_interval)
+            self.update_interval = (
+                _INTERVAL_CHARGING if current_charging else _INTERVAL_IDLE
+            )
             
             _LOGGER.info(
-                "Charging state changed to %s, polling interval set to %d seconds",
+                "Charging state changed to %s, polling interval set to %s",
                 "CHARGING" if current_charging else "NOT CHARGING",
-                new_interval
+                self.update_interval
             )
         
         # Track session changes for cost updates
@@ -402,11 +809,7 @@ class LaddelDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def _fetch_recent_sessions(self, page: int = 0) -> dict[str, Any]:
         """Fetch recent charging sessions for cost tracking."""
-        if not self.access_token:
-            raise UpdateFailed("No access token available")
-
-        url = f"{BASE_URL}{HISTORY_SESSIONS_ENDPOINT}?page={page}"
-        return await self._make_api_request(url)
+        return await self._api_get(HISTORY_SESSIONS_URL, {"page": page})
 
     async def stop_charging_session(self, session_id: str) -> bool:
         """Stop an active charging session."""
@@ -414,24 +817,19 @@ class LaddelDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error("No access token available for stopping session")
             return False
 
-        url = f"{BASE_URL}{STOP_SESSION_ENDPOINT}"
-        data = {"sessionId": session_id}
-
         try:
-            await self._make_api_request(url, method="POST", data=data)
+            await self._api_post(STOP_SESSION_URL, {"sessionId": session_id})
             _LOGGER.info("Successfully scheduled stop for session: %s", session_id)
             return True
         except Exception as e:
             _LOGGER.error("Error stopping charging session: %s", e)
             return False
 
+    # The charger list changes infrequently
+    @async_ttl_cache(timedelta(minutes=15))
     async def _fetch_latest_chargers(self) -> dict[str, Any]:
         """Fetch latest used chargers."""
-        if not self.access_token:
-            raise UpdateFailed("No access token available")
-
-        url = f"{BASE_URL}{LATEST_CHARGERS_ENDPOINT}"
-        return await self._make_api_request(url)
+        return await self._api_get(LATEST_CHARGERS_URL)
 
     async def start_charging_session(
         self, 
@@ -454,7 +852,6 @@ class LaddelDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error("No charger ID available for starting session")
             return False
 
-        url = f"{BASE_URL}{START_SESSION_ENDPOINT}"
         data = {
             "chargerId": charger_id,
             "scheduledStartTime": scheduled_start_time,
@@ -464,96 +861,9 @@ class LaddelDataUpdateCoordinator(DataUpdateCoordinator):
         }
 
         try:
-            await self._make_api_request(url, method="POST", data=data)
+            await self._api_post(START_SESSION_URL, data)
             _LOGGER.info("Successfully scheduled start for charger: %s", charger_id)
             return True
         except Exception as e:
             _LOGGER.error("Error starting charging session: %s", e)
             return False
-
-    async def _fetch_facility_info_cached(self, facility_id: str) -> dict[str, Any]:
-        """Fetch facility information with caching (facility info rarely changes)."""
-        now = datetime.now()
-        cache_duration = timedelta(hours=1)  # Cache facility info for 1 hour
-        
-        # Check if we have valid cached data
-        if (facility_id in self._facility_cache and 
-            self._facility_cache_time and 
-            now - self._facility_cache_time < cache_duration):
-            _LOGGER.debug("Using cached facility info for ID: %s", facility_id)
-            return self._facility_cache[facility_id]
-        
-        # Fetch fresh data
-        _LOGGER.debug("Fetching fresh facility info for ID: %s", facility_id)
-        try:
-            facility_data = await self._fetch_facility_info(facility_id)
-            
-            # Cache the result
-            self._facility_cache[facility_id] = facility_data
-            self._facility_cache_time = now
-            
-            return facility_data
-        except Exception as e:
-            # Return cached data if available, even if expired
-            if facility_id in self._facility_cache:
-                _LOGGER.warning("Using stale facility cache due to error: %s", e)
-                return self._facility_cache[facility_id]
-            raise
-
-    async def _fetch_latest_chargers_cached(self) -> dict[str, Any]:
-        """Fetch latest chargers with caching (charger list changes infrequently)."""
-        now = datetime.now()
-        cache_duration = timedelta(minutes=15)  # Cache chargers for 15 minutes
-        
-        # Check if we have valid cached data
-        if (self._latest_chargers_cache and 
-            self._latest_chargers_cache_time and 
-            now - self._latest_chargers_cache_time < cache_duration):
-            _LOGGER.debug("Using cached latest chargers")
-            return self._latest_chargers_cache
-        
-        # Fetch fresh data
-        _LOGGER.debug("Fetching fresh latest chargers")
-        try:
-            chargers_data = await self._fetch_latest_chargers()
-            
-            # Cache the result
-            self._latest_chargers_cache = chargers_data
-            self._latest_chargers_cache_time = now
-            
-            return chargers_data
-        except Exception as e:
-            # Return cached data if available, even if expired
-            if self._latest_chargers_cache:
-                _LOGGER.warning("Using stale chargers cache due to error: %s", e)
-                return self._latest_chargers_cache
-            raise
-
-    async def _fetch_subscription_data_cached(self) -> dict[str, Any]:
-        """Fetch subscription data with caching (subscriptions auto-renew, rarely change)."""
-        now = datetime.now()
-        cache_duration = timedelta(hours=24)  # Cache subscription for 24 hours
-        
-        # Check if we have valid cached data
-        if (self._subscription_cache and 
-            self._subscription_cache_time and 
-            now - self._subscription_cache_time < cache_duration):
-            _LOGGER.debug("Using cached subscription data")
-            return self._subscription_cache
-        
-        # Fetch fresh data
-        _LOGGER.debug("Fetching fresh subscription data")
-        try:
-            subscription_data = await self._fetch_subscription_data()
-            
-            # Cache the result
-            self._subscription_cache = subscription_data
-            self._subscription_cache_time = now
-            
-            return subscription_data
-        except Exception as e:
-            # Return cached data if available, even if expired
-            if self._subscription_cache:
-                _LOGGER.warning("Using stale subscription cache due to error: %s", e)
-                return self._subscription_cache
-            raise
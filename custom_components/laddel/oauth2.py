@@ -3,16 +3,18 @@ from __future__ import annotations
 
 import base64
 import hashlib
-import html
 import logging
 import secrets
-import re
+from html.parser import HTMLParser
 from typing import Any
+from urllib.parse import parse_qs, urlencode, urlsplit
 
+import orjson
 import voluptuous as vol
 import aiohttp
 from homeassistant import config_entries
 from homeassistant.helpers import config_entry_oauth2_flow
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.network import get_url
 
 from .const import (
@@ -27,10 +29,38 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+class _FormFound(Exception):
+    """Sentinel to stop HTML parsing at the first matching form."""
+
+
+class _FormActionFinder(HTMLParser):
+    """Find the login form's action URL without scanning the whole page.
+
+    The login HTML can be large; a streaming parse that bails out at the
+    first matching <form> beats a full-buffer regex scan, and HTMLParser
+    decodes entities in attribute values for free.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.action: str | None = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag != "form":
+            return
+        for name, value in attrs:
+            if name == "action" and value and "login-actions/authenticate" in value:
+                self.action = value
+                raise _FormFound
+
+
 class LaddelDirectOAuth2FlowHandler(config_entry_oauth2_flow.AbstractOAuth2FlowHandler):
     """Handle Laddel OAuth2 authentication with direct credential input."""
     
     DOMAIN = DOMAIN
+
+    # Keycloak's credential-submission endpoint; only the query varies
+    AUTH_ENDPOINT = "https://id.laddel.no/realms/laddel-app-prod/login-actions/authenticate"
     
     @property
     def logger(self):
@@ -59,19 +89,29 @@ class LaddelDirectOAuth2FlowHandler(config_entry_oauth2_flow.AbstractOAuth2FlowH
         self.code_challenge = code_challenge
         self.state = secrets.token_urlsafe(16)
         self.nonce = secrets.token_urlsafe(16)
-        
+        # The Referer for the credential POST is fully determined here;
+        # build it once per flow instead of per authentication attempt
+        self._referer = f"{OAUTH2_AUTHORIZE}?" + urlencode({
+            "redirect_uri": OAUTH2_REDIRECT_URI,
+            "client_id": OAUTH2_CLIENT_ID,
+            "response_type": "code",
+            "scope": OAUTH2_SCOPE,
+            "code_challenge": self.code_challenge,
+            "code_challenge_method": "S256",
+            "state": self.state,
+            "nonce": self.nonce,
+        })
 
 
     def _extract_form_action(self, html_content: str) -> str | None:
         """Extract the form action URL from the HTML login page."""
-        # Look for the login form action URL
-        form_pattern = r'<form[^>]*action="([^"]*login-actions/authenticate[^"]*)"'
-        match = re.search(form_pattern, html_content)
-        
-        if match:
-            action_url = match.group(1)
-            # Decode HTML entities (like &amp; -> &)
-            action_url = html.unescape(action_url)
+        parser = _FormActionFinder()
+        try:
+            parser.feed(html_content)
+        except _FormFound:
+            pass
+
+        if action_url := parser.action:
             # Make it absolute if it's relative
             if action_url.startswith('/'):
                 action_url = f"https://id.laddel.no{action_url}"
@@ -180,9 +220,7 @@ class LaddelDirectOAuth2FlowHandler(config_entry_oauth2_flow.AbstractOAuth2FlowH
                     raise Exception("Could not find form action URL in HTML")
                 
                 # Parse the form action URL to extract session parameters
-                from urllib.parse import urlparse, parse_qs
-                parsed_url = urlparse(form_action_url)
-                query_params = parse_qs(parsed_url.query)
+                query_params = parse_qs(urlsplit(form_action_url).query)
                 
                 # Extract the key parameters we need for authentication
                 self.session_code = query_params.get('session_code', [''])[0]
@@ -210,7 +248,6 @@ class LaddelDirectOAuth2FlowHandler(config_entry_oauth2_flow.AbstractOAuth2FlowH
             raise Exception("No credentials found in flow context")
         
         # Build the authentication endpoint URL
-        auth_endpoint = f"https://id.laddel.no/realms/laddel-app-prod/login-actions/authenticate"
         auth_params = {
             "session_code": self.session_code,
             "execution": self.execution,
@@ -219,7 +256,7 @@ class LaddelDirectOAuth2FlowHandler(config_entry_oauth2_flow.AbstractOAuth2FlowH
             "client_data": self.client_data
         }
         
-        auth_url = f"{auth_endpoint}?{self._build_query_string(auth_params)}"
+        auth_url = f"{self.AUTH_ENDPOINT}?{self._build_query_string(auth_params)}"
         
         # Prepare the POST data
         post_data = {
@@ -234,7 +271,7 @@ class LaddelDirectOAuth2FlowHandler(config_entry_oauth2_flow.AbstractOAuth2FlowH
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
             "Origin": "https://id.laddel.no",
-            "Referer": f"{OAUTH2_AUTHORIZE}?{self._build_query_string({'redirect_uri': OAUTH2_REDIRECT_URI, 'client_id': OAUTH2_CLIENT_ID, 'response_type': 'code', 'scope': OAUTH2_SCOPE, 'code_challenge': self.code_challenge, 'code_challenge_method': 'S256', 'state': self.state, 'nonce': self.nonce})}"
+            "Referer": self._referer
         }
         
         try:
@@ -242,12 +279,11 @@ class LaddelDirectOAuth2FlowHandler(config_entry_oauth2_flow.AbstractOAuth2FlowH
                 # Check if we got redirected (302 is success)
                 if response.status == 302:
                     redirect_location = response.headers.get('Location')
-                    if redirect_location and 'code=' in redirect_location:
-                        # Extract the authorization code
-                        code_match = re.search(r'code=([^&]+)', redirect_location)
-                        if code_match:
-                            auth_code = code_match.group(1)
-
+                    if redirect_location:
+                        # Extract the authorization code via structured
+                        # URL parsing rather than a regex over the header
+                        query = parse_qs(urlsplit(redirect_location).query)
+                        if auth_code := query.get('code', [None])[0]:
                             return auth_code
                 
                 # If no redirect or no code, try to read the response
@@ -276,19 +312,19 @@ class LaddelDirectOAuth2FlowHandler(config_entry_oauth2_flow.AbstractOAuth2FlowH
             "Accept": "application/json",
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                OAUTH2_TOKEN,
-                data=token_data,
-                headers=headers
-            ) as response:
-                if response.status != 200:
-                    text = await response.text()
-                    raise Exception(f"Token exchange failed: {response.status} - {text}")
-                
-                return await response.json()
+        # No cookie state needed here, so reuse HA's shared session
+        session = async_get_clientsession(self.hass)
+        async with session.post(
+            OAUTH2_TOKEN,
+            data=token_data,
+            headers=headers
+        ) as response:
+            if response.status != 200:
+                text = await response.text()
+                raise Exception(f"Token exchange failed: {response.status} - {text}")
+
+            return orjson.loads(await response.read())
 
     def _build_query_string(self, params: dict[str, Any]) -> str:
         """Build a query string from parameters."""
-        from urllib.parse import urlencode
         return urlencode(params)